@@ -149,6 +149,9 @@ default_enum_deserializer = deserializers.default_enum_deserializer
 default_datetime_deserializer = deserializers.default_datetime_deserializer
 default_date_deserializer = deserializers.default_date_deserializer
 default_string_deserializer = deserializers.default_string_deserializer
+default_int_deserializer = deserializers.default_int_deserializer
+default_float_deserializer = deserializers.default_float_deserializer
+default_bool_deserializer = deserializers.default_bool_deserializer
 default_primitive_deserializer = deserializers.default_primitive_deserializer
 default_mapping_deserializer = deserializers.default_mapping_deserializer
 default_iterable_deserializer = deserializers.default_iterable_deserializer
@@ -174,7 +177,10 @@ set_deserializer(default_enum_deserializer, Enum)
 set_deserializer(default_datetime_deserializer, datetime)
 set_deserializer(default_date_deserializer, date)
 set_deserializer(default_string_deserializer, str)
-set_deserializer(default_primitive_deserializer, (int, float, bool, None))
+set_deserializer(default_int_deserializer, int)
+set_deserializer(default_float_deserializer, float)
+set_deserializer(default_bool_deserializer, bool)
+set_deserializer(default_primitive_deserializer, None)
 set_deserializer(default_mapping_deserializer, Mapping, False)
 set_deserializer(default_iterable_deserializer, Iterable, False)
 set_deserializer(default_object_deserializer, object, False)
@@ -12,6 +12,7 @@ from jsons.exceptions import UnknownClassError
 
 
 VALID_TYPES = (str, int, float, bool, list, tuple, set, dict, type(None))
+VALID_TYPES_SET = frozenset(VALID_TYPES)  # For O(1) membership tests.
 META_ATTR = '-meta'  # The name of the attribute holding meta info.
 
 
@@ -23,6 +24,11 @@ class StateHolder:
     _classes_deserializers = list()
     _serializers = dict()
     _deserializers = dict()
+    _serializers_by_type = dict()
+    _deserializers_by_type = dict()
+    _serializer_cache = dict()
+    _deserializer_cache = dict()
+    _cls_name_cache = dict()
     _announced_classes = dict()
     _suppress_warnings = False
 
@@ -49,18 +55,19 @@ def get_class_name(cls: type,
     :return: the name of ``cls``, transformed if a transformer is given.
     """
 
-    transformer = transformer or (lambda x: x)
     cls_name = _get_special_cases(cls)
     if cls_name:
-        return transformer(cls_name)
+        return transformer(cls_name) if transformer else cls_name
     if cls in fork_inst._announced_classes:
-        return transformer(fork_inst._announced_classes[cls])
+        announced_name = fork_inst._announced_classes[cls]
+        return transformer(announced_name) if transformer else announced_name
     cls_name = _get_simple_name(cls)
     if fully_qualified:
         module = _get_module(cls)
         if module:
             cls_name = '{}.{}'.format(module, cls_name)
-    cls_name = transformer(cls_name)
+    if transformer:
+        cls_name = transformer(cls_name)
     return cls_name
 
 
@@ -34,7 +34,7 @@ def dump(obj: object,
     :return: the serialized obj as a JSON type.
     """
     kwargs = _check_for_recursion(obj, **kwargs)
-    if cls and not hasattr(cls, '__slots__'):
+    if cls and getattr(cls, '__slots__', None) is None:
         raise SerializationError('Invalid type: "{}". Only types that have a '
                                  '__slots__ defined are allowed when '
                                  'providing "cls".'
@@ -34,5 +34,8 @@ def announce_class(
     """
     cls_name = cls_name or get_class_name(cls, fully_qualified=True,
                                           fork_inst=fork_inst)
-    fork_inst._announced_classes[cls] = cls_name
-    fork_inst._announced_classes[cls_name] = cls
+    if fork_inst._announced_classes.get(cls) != cls_name:
+        fork_inst._announced_classes[cls] = cls_name
+        fork_inst._announced_classes[cls_name] = cls
+        # The name under which cls was cached may now be outdated.
+        fork_inst._cls_name_cache.pop(cls, None)
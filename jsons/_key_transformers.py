@@ -5,8 +5,13 @@ This module contains functions that can be used to transform keys of
 dictionaries.
 """
 import re
+from functools import lru_cache
 
 
+_SNAKECASE_PATTERN = re.compile(r'([a-z])([A-Z])')
+
+
+@lru_cache(maxsize=1024)
 def camelcase(str_: str) -> str:
     """
     Return ``s`` in camelCase.
@@ -20,6 +25,7 @@ def camelcase(str_: str) -> str:
     return str_[0].lower() + str_[1:]
 
 
+@lru_cache(maxsize=1024)
 def snakecase(str_: str) -> str:
     """
     Return ``s`` in snake_case.
@@ -28,9 +34,10 @@ def snakecase(str_: str) -> str:
     """
     str_ = str_.replace('-', '_')
     str_ = str_[0].lower() + str_[1:]
-    return re.sub(r'([a-z])([A-Z])', '\\1_\\2', str_).lower()
+    return _SNAKECASE_PATTERN.sub('\\1_\\2', str_).lower()
 
 
+@lru_cache(maxsize=1024)
 def pascalcase(str_: str) -> str:
     """
     Return ``s`` in PascalCase.
@@ -41,6 +48,7 @@ def pascalcase(str_: str) -> str:
     return camelcase_str[0].upper() + camelcase_str[1:]
 
 
+@lru_cache(maxsize=1024)
 def lispcase(str_: str) -> str:
     """
     Return ``s`` in lisp-case.
@@ -32,6 +32,7 @@ def set_serializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: None.
     """
+    _invalidate_lookup_caches(fork_inst, '_serializer_cache')
     if isinstance(cls, Sequence):
         for cls_ in cls:
             set_serializer(func, cls_, high_prio, fork_inst)
@@ -41,8 +42,10 @@ def set_serializer(
         cls_name = get_class_name(cls, fork_inst=fork_inst,
                                   fully_qualified=True)
         fork_inst._serializers[cls_name.lower()] = func
+        fork_inst._serializers_by_type[cls] = func
     else:
         fork_inst._serializers['nonetype'] = func
+        fork_inst._serializers_by_type[type(None)] = func
 
 
 def set_deserializer(
@@ -69,6 +72,7 @@ def set_deserializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: None.
     """
+    _invalidate_lookup_caches(fork_inst, '_deserializer_cache')
     if isinstance(cls, Sequence):
         for cls_ in cls:
             set_deserializer(func, cls_, high_prio, fork_inst)
@@ -78,8 +82,10 @@ def set_deserializer(
         cls_name = get_class_name(cls, fork_inst=fork_inst,
                                   fully_qualified=True)
         fork_inst._deserializers[cls_name.lower()] = func
+        fork_inst._deserializers_by_type[cls] = func
     else:
         fork_inst._deserializers['nonetype'] = func
+        fork_inst._deserializers_by_type[type(None)] = func
 
 
 def get_serializer(
@@ -91,8 +97,12 @@ def get_serializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: a serializer function.
     """
-    serializer = _get_lizer(cls, fork_inst._serializers,
-                            fork_inst._classes_serializers, fork_inst)
+    serializer = fork_inst._serializer_cache.get(cls)
+    if serializer is None:
+        serializer = _get_lizer(cls, fork_inst._serializers,
+                                fork_inst._serializers_by_type,
+                                fork_inst._classes_serializers, fork_inst)
+        fork_inst._serializer_cache[cls] = serializer
     return serializer
 
 
@@ -105,41 +115,67 @@ def get_deserializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: a deserializer function.
     """
-    deserializer = _get_lizer(cls, fork_inst._deserializers,
-                              fork_inst._classes_deserializers, fork_inst)
+    deserializer = fork_inst._deserializer_cache.get(cls)
+    if deserializer is None:
+        deserializer = _get_lizer(cls, fork_inst._deserializers,
+                                  fork_inst._deserializers_by_type,
+                                  fork_inst._classes_deserializers, fork_inst)
+        fork_inst._deserializer_cache[cls] = deserializer
     return deserializer
 
 
 def _get_lizer(
         cls: type,
         lizers: Dict[str, callable],
+        lizers_by_type: Dict[type, callable],
         classes_lizers: list,
         fork_inst: type,
         recursive: bool = False) -> callable:
-    cls_name = get_class_name(cls, str.lower, fork_inst=fork_inst,
-                              fully_qualified=True)
+    lizer = lizers_by_type.get(cls, None)
+    if lizer:
+        return lizer
+    cls_name = _get_lowered_name(cls, fork_inst)
     lizer = (lizers.get(cls_name, None)
-             or _get_lizer_by_parents(cls, lizers, classes_lizers, fork_inst))
+             or _get_lizer_by_parents(cls, lizers_by_type, classes_lizers))
     if not lizer and not recursive:
-        return _get_lizer(cls.__supertype__, lizers,
+        return _get_lizer(cls.__supertype__, lizers, lizers_by_type,
                           classes_lizers, fork_inst, True)
     return lizer
 
 
 def _get_lizer_by_parents(
         cls: type,
-        lizers: Dict[str, callable],
-        classes_lizers: list,
-        fork_inst: type) -> callable:
+        lizers_by_type: Dict[type, callable],
+        classes_lizers: list) -> callable:
     result = None
     parents = _get_parents(cls, classes_lizers)
     if parents:
-        pname = get_class_name(parents[0], str.lower, fork_inst=fork_inst,
-                               fully_qualified=True)
-        result = lizers[pname]
+        result = lizers_by_type[parents[0]]
     return result
 
 
+def _invalidate_lookup_caches(fork_inst: type, cache_attr: str) -> None:
+    # The registries of fork_inst may be inherited (e.g. when registering on
+    # JsonSerializable without a fork), in which case lookups through any
+    # class sharing them may have been cached. Clear every cache in the
+    # hierarchy in place rather than rebinding it on fork_inst only.
+    for cls_ in fork_inst.__mro__:
+        cache = cls_.__dict__.get(cache_attr)
+        if cache:
+            cache.clear()
+
+
+def _get_lowered_name(cls: type, fork_inst: type) -> str:
+    # Return the cached lowered class name of ``cls``; lowering allocates a
+    # fresh string and this runs on every lookup.
+    name = fork_inst._cls_name_cache.get(cls)
+    if name is None:
+        name = get_class_name(cls, str.lower, fork_inst=fork_inst,
+                              fully_qualified=True)
+        fork_inst._cls_name_cache[cls] = name
+    return name
+
+
 def _get_parents(cls: type, lizers: list) -> list:
     """
     Return a list of serializers or deserializers that can handle a parent
@@ -150,10 +186,19 @@ def _get_parents(cls: type, lizers: list) -> list:
     """
     parents = []
     naked_cls = get_naked_class(cls)
+    mro = set(getattr(naked_cls, '__mro__', ()))
     for cls_ in lizers:
-        try:
-            if issubclass(naked_cls, cls_):
+        if type(cls_) is type:
+            # For plain classes, a membership test in the MRO is equivalent
+            # to issubclass, but only costs a single hash probe.
+            if cls_ in mro:
                 parents.append(cls_)
-        except (TypeError, AttributeError):
-            pass  # Some types do not support `issubclass` (e.g. Union).
+        else:
+            # ABCs and the like may accept subclasses that are not in the
+            # MRO, so they still require issubclass.
+            try:
+                if issubclass(naked_cls, cls_):
+                    parents.append(cls_)
+            except (TypeError, AttributeError):
+                pass  # Some types do not support `issubclass` (e.g. Union).
     return parents
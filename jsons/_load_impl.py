@@ -14,7 +14,12 @@ from jsons._common_impl import (
     get_class_name,
     get_cls_and_meta,
     determine_precedence,
-    VALID_TYPES)
+    META_ATTR,
+    VALID_TYPES,
+    VALID_TYPES_SET)
+
+_VALID_TYPES_STR = ', '.join(get_class_name(typ, fully_qualified=True)
+                             for typ in VALID_TYPES)
 
 
 def load(
@@ -66,7 +71,9 @@ def load(
     :param kwargs: the keyword args are passed on to the deserializer function.
     :return: an instance of ``cls`` if given, a dict otherwise.
     """
-    if _should_skip(json_obj, cls, strict):
+    if not strict and (json_obj is None or type(json_obj) is cls):
+        return json_obj
+    if cls is Any:
         return json_obj
     if isinstance(cls, str):
         cls = get_cls_from_str(cls, json_obj, fork_inst)
@@ -74,18 +81,17 @@ def load(
         json_obj, cls, fork_inst, kwargs.get('_inferred_cls', False))
 
     deserializer = get_deserializer(cls, fork_inst)
-    kwargs_ = {
-        'strict': strict,
-        'fork_inst': fork_inst,
-        'attr_getters': attr_getters,
-        'meta_hints': meta_hints,
-        **kwargs
-    }
+    # kwargs is a fresh dict already, so it can be extended in place; only
+    # meta_hints may have been given by the caller and then takes precedence.
+    kwargs['strict'] = strict
+    kwargs['fork_inst'] = fork_inst
+    kwargs['attr_getters'] = attr_getters
+    kwargs.setdefault('meta_hints', meta_hints)
     try:
-        return deserializer(json_obj, cls, **kwargs_)
+        return deserializer(json_obj, cls, **kwargs)
+    except JsonsError:
+        raise
     except Exception as err:
-        if isinstance(err, JsonsError):
-            raise
         raise DeserializationError(str(err), json_obj, cls)
 
 
@@ -155,28 +161,22 @@ def _check_and_get_cls_and_meta_hints(
         fork_inst: type,
         inferred_cls: bool) -> Tuple[type, Optional[dict]]:
     # Check if json_obj is of a valid type and return the cls.
-    if type(json_obj) not in VALID_TYPES:
+    if type(json_obj) not in VALID_TYPES_SET:
         invalid_type = get_class_name(type(json_obj), fork_inst=fork_inst,
                                       fully_qualified=True)
-        valid_types = [get_class_name(typ, fork_inst=fork_inst,
-                                      fully_qualified=True)
-                       for typ in VALID_TYPES]
         msg = ('Invalid type: "{}", only arguments of the following types are '
-               'allowed: {}'.format(invalid_type, ", ".join(valid_types)))
+               'allowed: {}'.format(invalid_type, _VALID_TYPES_STR))
         raise DeserializationError(msg, json_obj, cls)
     if json_obj is None:
         raise DeserializationError('Cannot load None with strict=True',
                                    json_obj, cls)
 
+    if not isinstance(json_obj, dict) or META_ATTR not in json_obj:
+        # Without meta info there is nothing to determine precedence over:
+        # the given cls wins (or the type of json_obj if no cls was given).
+        return cls or type(json_obj), {}
+
     cls_from_meta, meta = get_cls_and_meta(json_obj, fork_inst)
     meta_hints = meta.get('classes', {}) if meta else {}
     return determine_precedence(
         cls, cls_from_meta, type(json_obj), inferred_cls), meta_hints
-
-
-def _should_skip(json_obj: object, cls: type, strict: bool):
-    if not strict:
-        if json_obj is None or type(json_obj) == cls:
-            return True
-    if cls is Any:
-        return True
@@ -33,6 +33,10 @@ class JsonSerializable(StateHolder):
         result._classes_deserializers = cls._classes_deserializers.copy()
         result._serializers = cls._serializers.copy()
         result._deserializers = cls._deserializers.copy()
+        result._serializers_by_type = cls._serializers_by_type.copy()
+        result._deserializers_by_type = cls._deserializers_by_type.copy()
+        result._serializer_cache = {}
+        result._deserializer_cache = {}
         result._fork_counter = 0
         return result
 
@@ -59,6 +63,9 @@ class JsonSerializable(StateHolder):
         :return: a class with customized behavior.
         """
         def _wrapper(inst, **kwargs_):
+            if not kwargs_:
+                # The common case; no merge with the bound kwargs needed.
+                return dump(inst, **kwargs)
             return dump(inst, **{**kwargs_, **kwargs})
 
         type_ = cls.fork() if fork else cls
@@ -90,6 +97,9 @@ class JsonSerializable(StateHolder):
         """
         @classmethod
         def _wrapper(cls_, inst, **kwargs_):
+            if not kwargs_:
+                # The common case; no merge with the bound kwargs needed.
+                return load(inst, cls_, **kwargs)
             return load(inst, cls_, **{**kwargs_, **kwargs})
         type_ = cls.fork() if fork else cls
         type_.load = _wrapper
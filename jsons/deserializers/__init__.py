@@ -5,10 +5,13 @@ deserialization process of a particular type as follows:
 ``jsons.set_deserializer(custom_deserializer, SomeClass)``
 """
 from jsons._key_transformers import snakecase, camelcase, pascalcase, lispcase
+from jsons.deserializers.default_bool import default_bool_deserializer
 from jsons.deserializers.default_datetime import default_datetime_deserializer
 from jsons.deserializers.default_date import default_date_deserializer
 from jsons.deserializers.default_dict import default_dict_deserializer
 from jsons.deserializers.default_enum import default_enum_deserializer
+from jsons.deserializers.default_float import default_float_deserializer
+from jsons.deserializers.default_int import default_int_deserializer
 from jsons.deserializers.default_list import default_list_deserializer
 from jsons.deserializers.default_iterable import default_iterable_deserializer
 from jsons.deserializers.default_object import default_object_deserializer
@@ -0,0 +1,18 @@
+from typing import Optional
+from jsons.deserializers.default_primitive import default_primitive_deserializer
+
+
+def default_bool_deserializer(obj: object,
+                              cls: Optional[type] = None,
+                              **kwargs) -> bool:
+    """
+    Deserialize a bool: return the given value if it already is a bool or
+    cast it otherwise.
+    :param obj: the value that is to be deserialized.
+    :param cls: not used.
+    :param kwargs: not used.
+    :return: ``obj`` as a ``bool``.
+    """
+    if type(obj) is bool:
+        return obj
+    return default_primitive_deserializer(obj, bool)
@@ -0,0 +1,18 @@
+from typing import Optional
+from jsons.deserializers.default_primitive import default_primitive_deserializer
+
+
+def default_float_deserializer(obj: object,
+                               cls: Optional[type] = None,
+                               **kwargs) -> float:
+    """
+    Deserialize a float: return the given value if it already is a float or
+    cast it otherwise.
+    :param obj: the value that is to be deserialized.
+    :param cls: not used.
+    :param kwargs: not used.
+    :return: ``obj`` as a ``float``.
+    """
+    if type(obj) is float:
+        return obj
+    return default_primitive_deserializer(obj, float)
@@ -0,0 +1,18 @@
+from typing import Optional
+from jsons.deserializers.default_primitive import default_primitive_deserializer
+
+
+def default_int_deserializer(obj: object,
+                             cls: Optional[type] = None,
+                             **kwargs) -> int:
+    """
+    Deserialize an int: return the given value if it already is an int or
+    cast it otherwise.
+    :param obj: the value that is to be deserialized.
+    :param cls: not used.
+    :param kwargs: not used.
+    :return: ``obj`` as an ``int``.
+    """
+    if type(obj) is int:
+        return obj
+    return default_primitive_deserializer(obj, int)
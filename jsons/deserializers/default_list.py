@@ -1,4 +1,16 @@
+from jsons._common_impl import StateHolder
+from jsons._lizers_impl import get_deserializer
 from jsons._load_impl import load
+from jsons.deserializers.default_bool import default_bool_deserializer
+from jsons.deserializers.default_float import default_float_deserializer
+from jsons.deserializers.default_int import default_int_deserializer
+
+
+_DEFAULT_PRIMITIVE_DESERIALIZERS = {
+    int: default_int_deserializer,
+    float: default_float_deserializer,
+    bool: default_bool_deserializer,
+}
 
 
 def default_list_deserializer(obj: list, cls: type = None, **kwargs) -> list:
@@ -16,4 +28,13 @@ def default_list_deserializer(obj: list, cls: type = None, **kwargs) -> list:
         # Mark the cls as 'inferred' so that later it is known where cls came
         # from and the precedence of classes can be determined.
         kwargs_['_inferred_cls'] = True
+    default_lizer = _DEFAULT_PRIMITIVE_DESERIALIZERS.get(cls_)
+    if (default_lizer is not None
+            and get_deserializer(cls_, kwargs.get('fork_inst', StateHolder))
+            is default_lizer
+            and all(type(x) is cls_ for x in obj)):
+        # A homogeneous list of numeric primitives deserializes to itself;
+        # skip the per-element dispatch through load. This only holds as
+        # long as the default deserializer is in charge of the elements.
+        return list(obj)
     return [load(x, cls_, **kwargs_) for x in obj]
@@ -12,6 +12,11 @@ from jsons._common_impl import (
 )
 
 
+# The constructor signature and type hints of a class do not change between
+# calls, so they are inspected only once per class.
+_CONSTRUCTOR_CACHE = {}
+
+
 def default_object_deserializer(
         obj: dict,
         cls: type,
@@ -52,8 +57,7 @@ def _get_constructor_args(
     # Loop through the signature of cls: the type we try to deserialize to. For
     # every required parameter, we try to get the corresponding value from
     # json_obj.
-    signature_parameters = inspect.signature(cls.__init__).parameters
-    hints = get_type_hints(cls.__init__)
+    signature_parameters, hints = _get_constructor_info(cls)
     attr_getters = dict(**(attr_getters or {}))
     value_for_attr_part = partial(_get_value_for_attr,
                                   obj=obj,
@@ -70,6 +74,17 @@ def _get_constructor_args(
     return constructor_args_in_obj
 
 
+def _get_constructor_info(cls) -> Tuple[dict, dict]:
+    # Return the (cached) signature parameters and type hints of the
+    # constructor of cls.
+    cached = _CONSTRUCTOR_CACHE.get(cls)
+    if cached is None:
+        cached = (inspect.signature(cls.__init__).parameters,
+                  get_type_hints(cls.__init__))
+        _CONSTRUCTOR_CACHE[cls] = cached
+    return cached
+
+
 def _get_value_for_attr(
         obj,
         cls,
@@ -12,6 +12,8 @@ def default_primitive_deserializer(obj: object,
     :param kwargs: not used.
     :return: ``obj``.
     """
+    if type(obj) is cls:
+        return obj
     result = obj
     if not isinstance(obj, cls):
         try:
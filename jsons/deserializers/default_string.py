@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import Optional
+from jsons._common_impl import StateHolder
+from jsons._lizers_impl import get_deserializer
 from jsons._load_impl import load
+from jsons.deserializers.default_datetime import default_datetime_deserializer
 from jsons.deserializers.default_primitive import default_primitive_deserializer
 from jsons.exceptions import DeserializationError
 
@@ -16,8 +19,17 @@ def default_string_deserializer(obj: str,
     :param kwargs: any keyword arguments.
     :return: the deserialized obj.
     """
+    fork_inst = kwargs.get('fork_inst', StateHolder)
+    if get_deserializer(datetime, fork_inst) is default_datetime_deserializer:
+        # Only strings that remotely look like RFC3339 can hold a datetime
+        # (a digit first, plus a 'T' and a ':'); checking that upfront keeps
+        # ordinary strings off the costly raise-and-catch path below. This
+        # pre-filter encodes what the default datetime deserializer accepts,
+        # so it must not be applied for a custom one.
+        if not (isinstance(obj, str) and obj
+                and 'T' in obj and ':' in obj and obj[0].isdigit()):
+            return default_primitive_deserializer(obj, str)
     try:
-        result = load(obj, datetime, **kwargs)
+        return load(obj, datetime, **kwargs)
     except DeserializationError:
-        result = default_primitive_deserializer(obj, str)
-    return result
+        return default_primitive_deserializer(obj, str)
@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import List
 from unittest import TestCase
 import jsons
 from jsons import default_string_deserializer, default_primitive_serializer
@@ -14,6 +16,44 @@ class TestCustomSerializer(TestCase):
         self.assertEqual(dumped, 'custom_serializer')
         self.assertEqual(loaded, 'custom_deserializer')
 
+    def test_custom_deserializer_for_list_elements(self):
+        jsons.set_deserializer(lambda obj, cls, **__: obj * 2, int)
+        try:
+            loaded = jsons.load([1, 2, 3], List[int], strict=True)
+            self.assertEqual([2, 4, 6], loaded)
+        finally:
+            jsons.set_deserializer(jsons.default_int_deserializer, int)
+
+    def test_custom_datetime_deserializer_for_strings(self):
+        def custom_deserializer(obj, cls=None, **kwargs):
+            return datetime.strptime(obj, '%Y-%m-%d %H:%M:%S')
+
+        jsons.set_deserializer(custom_deserializer, datetime)
+        try:
+            loaded = jsons.load('2000-01-01 10:00:00')
+            self.assertEqual(datetime(2000, 1, 1, 10, 0), loaded)
+        finally:
+            jsons.set_deserializer(jsons.default_datetime_deserializer,
+                                   datetime)
+
+    def test_set_custom_functions_after_lookup(self):
+        class C:
+            def __init__(self, x: int = 0):
+                self.x = x
+
+        # These calls populate the lookup caches for C.
+        dumped_before = jsons.dump(C())
+        jsons.load(dumped_before, C)
+
+        # Registering without a fork must invalidate the shared caches.
+        jsons.JsonSerializable.set_serializer(
+            lambda *_, **__: 'custom_serializer', C)
+        jsons.JsonSerializable.set_deserializer(
+            lambda *_, **__: 'custom_deserializer', C)
+
+        self.assertEqual('custom_serializer', jsons.dump(C()))
+        self.assertEqual('custom_deserializer', jsons.load({'x': 0}, C))
+
     @classmethod
     def tearDownClass(cls):
         jsons.set_serializer(default_primitive_serializer, str)
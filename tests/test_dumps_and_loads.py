@@ -36,3 +36,10 @@ class TestDumpsAndLoads(TestCase):
         loaded_obj = jsons.loads(s, B)
         self.assertEqual('B', loaded_obj.name)
         self.assertEqual('A', loaded_obj.a.name)
+
+    def test_loads_big_int(self):
+        # Integers beyond 64 bits must not lose precision.
+        big_int = 2 ** 64
+        loaded = jsons.loads(str(big_int))
+        self.assertIsInstance(loaded, int)
+        self.assertEqual(big_int, loaded)